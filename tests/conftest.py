@@ -5,17 +5,23 @@ Configured for SYNC SQLAlchemy (not async).
 """
 
 import pytest
-from typing import Generator, Dict, Any
+from typing import Generator, Dict, Any, Callable, ContextManager, Iterator, List
 from starlette.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.orm import raiseload, sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from datetime import datetime, timedelta
 import os
 from decimal import Decimal
+from contextlib import contextmanager
+from functools import lru_cache
+from types import SimpleNamespace
+from passlib.context import CryptContext
 
 from app.main import app
 from app.core.database import get_db, Base
+from app.core import security
 from app.core.security import create_access_token, get_password_hash
 from app.models.user import User
 from app.models.profile import UserProfile
@@ -31,12 +37,164 @@ TEST_DATABASE_URL = os.getenv(
     "DATABASE_URL", "postgresql://postgres:@localhost:5432/magicscholar_test"
 )
 
-test_engine = create_engine(
-    TEST_DATABASE_URL,
-    poolclass=StaticPool,
+# Each pytest-xdist worker gets its own test database so that workers
+# running in parallel never share tables.
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER", "main")
+
+TEST_DATABASE_NAME = f"magicscholar_test_{XDIST_WORKER}"
+
+test_database_url = make_url(TEST_DATABASE_URL)
+
+# TEST_DB=sqlite runs the integration tests against the in-memory SQLite
+# engine as well, for quick local runs without Postgres. Postgres stays the
+# default because some endpoints rely on Postgres-only SQL.
+TEST_DB = os.getenv("TEST_DB", "postgres").lower()
+
+# CREATE/DROP DATABASE cannot run inside a transaction, so these statements
+# go through the "postgres" maintenance database in autocommit mode.
+maintenance_engine = create_engine(
+    test_database_url.set(database="postgres"),
+    isolation_level="AUTOCOMMIT",
+)
+
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+# TEST_RAISELOAD=1 makes every lazy relationship load raise instead of
+# emitting SQL, so endpoints that fetch related rows one at a time (N+1)
+# fail loudly. Off by default until the routes eager-load what they use.
+if os.getenv("TEST_RAISELOAD") == "1":
+
+    @event.listens_for(TestSessionLocal, "do_orm_execute")
+    def _raise_on_lazy_load(orm_execute_state) -> None:
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load
+        ):
+            orm_execute_state.statement = orm_execute_state.statement.options(
+                raiseload("*", sql_only=True)
+            )
+
+
+# Production bcrypt cost makes every hash/verify take 100ms+. Tests only need
+# valid hashes, so drop to the minimum cost before any hash is computed.
+# Existing hashes still verify since the cost is stored in the hash itself.
+security.pwd_context = CryptContext(
+    schemes=["bcrypt"], bcrypt__rounds=4, deprecated="auto"
 )
 
-TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+TEST_INSTITUTION_IPEDS_ID = 166027  # MIT's real IPEDS ID
+TEST_SCHOLARSHIP_TITLE = "Test STEM Scholarship"
+TEST_USER_EMAIL = "test@example.com"
+TEST_USER_2_EMAIL = "test2@example.com"
+ADMIN_USER_EMAIL = "admin@example.com"
+
+@lru_cache(maxsize=None)
+def _password_hash(password: str) -> str:
+    """Hash each distinct test password once per run.
+
+    bcrypt is deliberately slow; reusing one salted hash per password is
+    fine here since no test depends on salts differing.
+    """
+    return get_password_hash(password)
+
+
+_TEST_PW_HASH = _password_hash("TestPassword123!")
+_ADMIN_PW_HASH = _password_hash("AdminPassword123!")
+
+
+def _new_test_user() -> User:
+    return User(
+        email=TEST_USER_EMAIL,
+        username="testuser",
+        first_name="Test",
+        last_name="User",
+        hashed_password=_TEST_PW_HASH,
+        is_active=True,
+        is_superuser=False,
+    )
+
+
+def _new_test_user_2() -> User:
+    return User(
+        email=TEST_USER_2_EMAIL,
+        username="testuser2",
+        first_name="Test",
+        last_name="User2",
+        hashed_password=_TEST_PW_HASH,
+        is_active=True,
+        is_superuser=False,
+    )
+
+
+def _new_admin_user() -> User:
+    return User(
+        email=ADMIN_USER_EMAIL,
+        username="adminuser",
+        first_name="Admin",
+        last_name="User",
+        hashed_password=_ADMIN_PW_HASH,
+        is_active=True,
+        is_superuser=True,
+    )
+
+
+def _seed_reference_data(session: Session) -> None:
+    """Insert the read-only rows that every test database starts with."""
+    institution = Institution(
+        ipeds_id=TEST_INSTITUTION_IPEDS_ID,
+        name="Massachusetts Institute of Technology",
+        city="Cambridge",
+        state="MA",
+        control_type=ControlType.PRIVATE_NONPROFIT,
+        student_faculty_ratio=Decimal("3.0"),
+        size_category="Medium",
+        locale="City: Large",
+    )
+    scholarship = Scholarship(
+        title=TEST_SCHOLARSHIP_TITLE,
+        organization="Test Foundation",
+        scholarship_type="stem",  # Must be one of the ScholarshipType enum values
+        amount_min=5000,
+        amount_max=10000,
+        deadline=datetime.now() + timedelta(days=60),
+        description="Scholarship for STEM students",
+        status="active",  # Default but explicit
+        difficulty_level="moderate",  # Default but explicit
+        is_renewable=False,
+    )
+    # Users are seeded too, so their ids (and therefore their JWTs) are the
+    # same in every test instead of advancing with the id sequence.
+    users = [_new_test_user(), _new_test_user_2(), _new_admin_user()]
+    session.add_all([institution, scholarship, *users])
+    session.commit()
+
+
+def _drop_database(conn: Connection, name: str) -> None:
+    """Drop a database if it exists."""
+    conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "integration: exercises the API against a real database"
+    )
+    config.addinivalue_line("markers", "auth: authentication and user flows")
+    config.addinivalue_line(
+        "markers", "postgres: relies on Postgres-only SQL, skipped with TEST_DB=sqlite"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    if TEST_DB != "sqlite":
+        return
+    skip_postgres = pytest.mark.skip(reason="needs Postgres, TEST_DB=sqlite")
+    for item in items:
+        if item.get_closest_marker("postgres"):
+            item.add_marker(skip_postgres)
 
 
 # ===========================
@@ -44,127 +202,274 @@ TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_eng
 # ===========================
 
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_test_database():
-    """Create all tables before each test and drop them after."""
-    Base.metadata.create_all(bind=test_engine)
-    yield
-    Base.metadata.drop_all(bind=test_engine)
+@pytest.fixture(scope="session")
+def test_engine() -> Generator[Engine, None, None]:
+    """Create and seed the database used for this test session."""
+    with maintenance_engine.connect() as conn:
+        _drop_database(conn, TEST_DATABASE_NAME)
+        conn.execute(text(f'CREATE DATABASE "{TEST_DATABASE_NAME}"'))
+
+    engine = create_engine(
+        test_database_url.set(database=TEST_DATABASE_NAME),
+        # Tests share the single connection held by _pg_connection.
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
+        pool_reset_on_return="rollback",
+        echo=False,
+        query_cache_size=1200,
+    )
+    Base.metadata.create_all(bind=engine)
+    with TestSessionLocal(bind=engine) as session:
+        _seed_reference_data(session)
+
+    yield engine
+
+    engine.dispose()
+    with maintenance_engine.connect() as conn:
+        _drop_database(conn, TEST_DATABASE_NAME)
+    maintenance_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine() -> Generator[Engine, None, None]:
+    """In-memory SQLite database for tests not marked as integration."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=False,
+        query_cache_size=1200,
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy
+    # emit BEGIN itself instead.
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    with TestSessionLocal(bind=engine) as session:
+        _seed_reference_data(session)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def _pg_connection(test_engine: Engine) -> Generator[Connection, None, None]:
+    """One Postgres connection shared by every integration test."""
+    with test_engine.connect() as connection:
+        yield connection
+
+
+@pytest.fixture(scope="session")
+def _sqlite_connection(sqlite_engine: Engine) -> Generator[Connection, None, None]:
+    """One SQLite connection shared by every non-integration test."""
+    with sqlite_engine.connect() as connection:
+        yield connection
 
 
 @pytest.fixture(scope="function")
-def db_session() -> Generator[Session, None, None]:
-    """Provide a database session for each test with automatic rollback."""
-    connection = test_engine.connect()
+def db_session(request: pytest.FixtureRequest) -> Generator[Session, None, None]:
+    """Provide a database session for each test with automatic rollback.
+
+    Each test runs inside an outer transaction that the session joins with
+    ``join_transaction_mode="create_savepoint"``: commits made by the test or
+    by endpoint code only release a SAVEPOINT, and the next statement opens a
+    fresh one, so rolling back the outer transaction undoes all of the test's
+    writes without touching the schema. The connection itself is
+    opened once per session and reused by every test.
+
+    Tests marked ``integration`` run against Postgres unless ``TEST_DB`` is
+    ``sqlite``; everything else uses the in-memory SQLite engine.
+    """
+    if TEST_DB != "sqlite" and request.node.get_closest_marker("integration"):
+        connection = request.getfixturevalue("_pg_connection")
+    else:
+        connection = request.getfixturevalue("_sqlite_connection")
+
     transaction = connection.begin()
-    session = TestSessionLocal(bind=connection)
+    session = TestSessionLocal(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
 
     yield session
 
     session.close()
     transaction.rollback()
-    connection.close()
 
 
-@pytest.fixture(scope="function")
-def client(db_session: Session) -> Generator[TestClient, None, None]:
-    """Provide a test client for API endpoints."""
+# The get_db override is registered once per session and hands out whatever
+# session the current test put here. A ContextVar would not work: TestClient
+# serves requests from its own portal thread, which never sees values set in
+# the test thread after the client has started.
+_active_db = SimpleNamespace(session=None)
+
+
+def _override_get_db() -> Generator[Session, None, None]:
+    yield _active_db.session
 
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
 
-    app.dependency_overrides[get_db] = override_get_db
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    """Provide a test client for API endpoints.
 
+    The app is started once per session, so lifespan events and router
+    wiring happen a single time; ``_bind_client_db`` points it at each
+    test's ``db_session``.
+    """
+    app.dependency_overrides[get_db] = _override_get_db
     with TestClient(app) as c:
         yield c
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(autouse=True)
+def _bind_client_db(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """Route the shared client's get_db to the current test's session."""
+    if "client" not in request.fixturenames:
+        yield
+        return
+
+    _active_db.session = request.getfixturevalue("db_session")
+
+    yield
+
+    _active_db.session = None
+    # The client outlives the test, so drop any cookies login/logout set
+    request.getfixturevalue("client").cookies.clear()
+
+
+# SAVEPOINT bookkeeping from join_transaction_mode is not endpoint SQL.
+_SAVEPOINT_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+@pytest.fixture
+def count_queries(db_session: Session) -> Callable[[], ContextManager[List[str]]]:
+    """Return a context manager that records SQL run on the test connection.
+
+    Wrap a request in ``with count_queries() as queries:`` and assert on
+    ``len(queries)`` to catch endpoints that issue a query per row (N+1).
+    """
+    connection = db_session.get_bind()
+
+    @contextmanager
+    def _count() -> Iterator[List[str]]:
+        queries: List[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if not statement.lstrip().upper().startswith(_SAVEPOINT_STATEMENTS):
+                queries.append(statement)
+
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            yield queries
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
 
-    app.dependency_overrides.clear()
+    return _count
 
 
 # ===========================
 # AUTHENTICATION FIXTURES
 # ===========================
 
+# Cached tokens are reused for the whole run, so give them a lifetime no
+# run can outlast instead of the app's default expiry.
+CACHED_TOKEN_LIFETIME = timedelta(days=1)
+
+
+@lru_cache(maxsize=None)
+def _access_token(user_id: int) -> str:
+    """Sign a JWT for a user id, reusing the token for repeated ids."""
+    return create_access_token(
+        subject=str(user_id), expires_delta=CACHED_TOKEN_LIFETIME
+    )
+
+
+@lru_cache(maxsize=None)
+def _bearer_headers(user_id: int) -> Dict[str, str]:
+    """Authorization header dict for a user id, built once per id.
+
+    The same dict is handed to every test for that id, so treat it as
+    read-only.
+    """
+    return {"Authorization": f"Bearer {_access_token(user_id)}"}
+
+
+def _seeded_user(db_session: Session, email: str) -> User:
+    return db_session.query(User).filter_by(email=email).one()
+
 
 @pytest.fixture
 def test_user(db_session: Session) -> User:
-    """Create a test user."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        first_name="Test",
-        last_name="User",
-        hashed_password=get_password_hash("TestPassword123!"),
-        is_active=True,
-        is_superuser=False,
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+    """Return the seeded test user."""
+    return _seeded_user(db_session, TEST_USER_EMAIL)
 
 
 @pytest.fixture
 def test_user_2(db_session: Session) -> User:
-    """Create a second test user."""
-    user = User(
-        email="test2@example.com",
-        username="testuser2",
-        first_name="Test",
-        last_name="User2",
-        hashed_password=get_password_hash("TestPassword123!"),
-        is_active=True,
-        is_superuser=False,
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+    """Return the seeded second test user."""
+    return _seeded_user(db_session, TEST_USER_2_EMAIL)
 
 
 @pytest.fixture
 def admin_user(db_session: Session) -> User:
-    """Create an admin user."""
-    user = User(
-        email="admin@example.com",
-        username="adminuser",
-        first_name="Admin",
-        last_name="User",
-        hashed_password=get_password_hash("AdminPassword123!"),
-        is_active=True,
-        is_superuser=True,
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+    """Return the seeded admin user."""
+    return _seeded_user(db_session, ADMIN_USER_EMAIL)
 
 
 @pytest.fixture
-def user_token(test_user: User) -> str:
-    """Generate JWT token for test user."""
-    return create_access_token(subject=str(test_user.id))
+def make_user(db_session: Session) -> Callable[..., User]:
+    """Return a callable that adds and commits an extra user for one test.
+
+    The password is hashed through the per-run cache, so repeated calls with
+    the same password cost a single bcrypt hash.
+    """
+
+    def _make(
+        email: str, username: str, password: str = "Password123!", **kwargs: Any
+    ) -> User:
+        # ORM-enabled INSERT..RETURNING skips the unit-of-work flush
+        user = db_session.scalars(
+            insert(User).returning(User),
+            [
+                {
+                    "email": email,
+                    "username": username,
+                    "hashed_password": _password_hash(password),
+                    **kwargs,
+                }
+            ],
+        ).one()
+        db_session.commit()
+        return user
+
+    return _make
 
 
 @pytest.fixture
-def admin_token(admin_user: User) -> str:
-    """Generate JWT token for admin user."""
-    return create_access_token(subject=str(admin_user.id))
+def auth_headers(test_user: User) -> Dict[str, str]:
+    """Auth headers with Bearer token for regular user."""
+    return _bearer_headers(test_user.id)
 
 
 @pytest.fixture
-def auth_headers(user_token: str) -> Dict[str, str]:
-    """Auth headers with Bearer token for regular user."""
-    return {"Authorization": f"Bearer {user_token}"}
+def user_2_headers(test_user_2: User) -> Dict[str, str]:
+    """Auth headers with Bearer token for the second test user."""
+    return _bearer_headers(test_user_2.id)
 
 
 @pytest.fixture
-def admin_headers(admin_token: str) -> Dict[str, str]:
+def admin_headers(admin_user: User) -> Dict[str, str]:
     """Auth headers with Bearer token for admin user."""
-    return {"Authorization": f"Bearer {admin_token}"}
+    return _bearer_headers(admin_user.id)
 
 
 # ===========================
@@ -172,11 +477,9 @@ def admin_headers(admin_token: str) -> Dict[str, str]:
 # ===========================
 
 
-@pytest.fixture
-def test_profile(db_session: Session, test_user: User) -> UserProfile:
-    """Create a test user profile."""
-    profile = UserProfile(
-        user_id=test_user.id,
+def _new_profile(user_id: int) -> UserProfile:
+    return UserProfile(
+        user_id=user_id,
         high_school="Test High School",
         graduation_year=2025,
         gpa=3.8,
@@ -187,47 +490,30 @@ def test_profile(db_session: Session, test_user: User) -> UserProfile:
         city="Boston",
         zip_code="02101",
     )
+
+
+@pytest.fixture
+def test_profile(db_session: Session, test_user: User) -> UserProfile:
+    """Create a test user profile."""
+    profile = _new_profile(test_user.id)
     db_session.add(profile)
     db_session.commit()
-    db_session.refresh(profile)
     return profile
 
 
 @pytest.fixture
 def test_institution(db_session: Session) -> Institution:
-    """Create a test institution (MIT)."""
-    institution = Institution(
-        ipeds_id=166027,  # MIT's real IPEDS ID
-        name="Massachusetts Institute of Technology",
-        city="Cambridge",
-        state="MA",
-        control_type=ControlType.PRIVATE_NONPROFIT,
-        student_faculty_ratio=Decimal("3.0"),
-        size_category="Medium",
-        locale="City: Large",
+    """Return the seeded test institution (MIT)."""
+    return (
+        db_session.query(Institution)
+        .filter_by(ipeds_id=TEST_INSTITUTION_IPEDS_ID)
+        .one()
     )
-    db_session.add(institution)
-    db_session.commit()
-    db_session.refresh(institution)
-    return institution
 
 
 @pytest.fixture
 def test_scholarship(db_session: Session) -> Scholarship:
-    """Create a test scholarship."""
-    scholarship = Scholarship(
-        title="Test STEM Scholarship",
-        organization="Test Foundation",
-        scholarship_type="stem",  # Must be one of the ScholarshipType enum values
-        amount_min=5000,
-        amount_max=10000,
-        deadline=datetime.now() + timedelta(days=60),
-        description="Scholarship for STEM students",
-        status="active",  # Default but explicit
-        difficulty_level="moderate",  # Default but explicit
-        is_renewable=False,
+    """Return the seeded test scholarship."""
+    return (
+        db_session.query(Scholarship).filter_by(title=TEST_SCHOLARSHIP_TITLE).one()
     )
-    db_session.add(scholarship)
-    db_session.commit()
-    db_session.refresh(scholarship)
-    return scholarship
@@ -5,10 +5,14 @@ SYNC version (no async/await) - matches sync SQLAlchemy backend.
 """
 
 import pytest
+from datetime import timedelta
+from typing import Callable, Optional
+from jose import jwt
 from starlette.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models.user import User
+from app.core.config import settings
 from app.core.security import verify_password, create_access_token
 
 
@@ -45,79 +49,45 @@ class TestUserRegistration:
         assert "password" not in data
         assert "hashed_password" not in data
     
-    def test_register_duplicate_email(
+    @pytest.mark.parametrize(
+        "duplicate_field,overrides,expected_status,detail_substr",
+        [
+            pytest.param("email", {}, 400, "email", id="duplicate_email"),
+            pytest.param("username", {}, 400, "username", id="duplicate_username"),
+            pytest.param(
+                None, {"email": "not-an-email"}, 422, None, id="invalid_email"
+            ),
+            pytest.param(None, {"password": "weak"}, 422, None, id="weak_password"),
+        ],
+    )
+    def test_register_rejected(
         self,
         client: TestClient,
-        test_user: User
-    ):
-        """Test registration fails with duplicate email"""
-        user_data = {
-            "email": test_user.email,
-            "username": "differentusername",
-            "password": "SecurePass123!",
-            "first_name": "Test",
-            "last_name": "User"
-        }
-        
-        response = client.post("/api/v1/auth/register", json=user_data)
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "email" in data["detail"].lower()
-    
-    def test_register_duplicate_username(
-        self,
-        client: TestClient,
-        test_user: User
-    ):
-        """Test registration fails with duplicate username"""
-        user_data = {
-            "email": "newemail@example.com",
-            "username": test_user.username,
-            "password": "SecurePass123!",
-            "first_name": "Test",
-            "last_name": "User"
-        }
-        
-        response = client.post("/api/v1/auth/register", json=user_data)
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "username" in data["detail"].lower()
-    
-    def test_register_invalid_email(
-        self,
-        client: TestClient
+        test_user: User,
+        duplicate_field: Optional[str],
+        overrides: dict,
+        expected_status: int,
+        detail_substr: Optional[str]
     ):
-        """Test registration fails with invalid email format"""
+        """Test registration fails for duplicate or invalid fields"""
         user_data = {
-            "email": "not-an-email",
-            "username": "testuser",
+            "email": "other@example.com",
+            "username": "otheruser",
             "password": "SecurePass123!",
             "first_name": "Test",
-            "last_name": "User"
-        }
-        
-        response = client.post("/api/v1/auth/register", json=user_data)
-        
-        assert response.status_code == 422
-    
-    def test_register_weak_password(
-        self,
-        client: TestClient
-    ):
-        """Test registration fails with weak password"""
-        user_data = {
-            "email": "test@example.com",
-            "username": "testuser",
-            "password": "weak",
-            "first_name": "Test",
-            "last_name": "User"
+            "last_name": "User",
+            **overrides
         }
+        if duplicate_field:
+            # Reuse test_user's value so registration collides with it
+            user_data[duplicate_field] = getattr(test_user, duplicate_field)
         
         response = client.post("/api/v1/auth/register", json=user_data)
         
-        assert response.status_code == 422
+        assert response.status_code == expected_status
+        if detail_substr:
+            data = response.json()
+            assert detail_substr in data["detail"].lower()
     
     def test_register_missing_required_fields(
         self,
@@ -150,8 +120,9 @@ class TestUserRegistration:
         response = client.post("/api/v1/auth/register", json=user_data)
         
         assert response.status_code == 200
+        user_id = response.json()["id"]
         
-        user = db_session.query(User).filter(User.email == user_data["email"]).first()
+        user = db_session.get(User, user_id)
         
         assert user.hashed_password != plain_password
         assert len(user.hashed_password) > 20
@@ -163,42 +134,35 @@ class TestUserRegistration:
 class TestUserLogin:
     """Test user login endpoints"""
     
-    def test_login_success_oauth2_form(
-        self,
-        client: TestClient,
-        test_user: User
-    ):
-        """Test successful login with OAuth2 form format"""
-        login_data = {
-            "username": test_user.email,
-            "password": "TestPassword123!"
-        }
-        
-        response = client.post(
-            "/api/v1/auth/login",
-            data=login_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "access_token" in data
-        assert data["token_type"] == "bearer"
-        assert "user" in data
-        assert data["user"]["email"] == test_user.email
-    
-    def test_login_success_json_format(
+    @pytest.mark.parametrize(
+        "path,login_field,as_form",
+        [
+            pytest.param("/api/v1/auth/login", "username", True, id="oauth2_form"),
+            pytest.param("/api/v1/auth/login-json", "email", False, id="json"),
+        ],
+    )
+    def test_login_success(
         self,
         client: TestClient,
-        test_user: User
+        test_user: User,
+        path: str,
+        login_field: str,
+        as_form: bool
     ):
-        """Test successful login with JSON format"""
+        """Test successful login with OAuth2 form and JSON formats"""
         login_data = {
-            "email": test_user.email,
+            login_field: test_user.email,
             "password": "TestPassword123!"
         }
         
-        response = client.post("/api/v1/auth/login-json", json=login_data)
+        if as_form:
+            response = client.post(
+                path,
+                data=login_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+        else:
+            response = client.post(path, json=login_data)
         
         assert response.status_code == 200
         data = response.json()
@@ -241,18 +205,15 @@ class TestUserLogin:
     def test_login_inactive_user(
         self,
         client: TestClient,
-        db_session: Session
+        make_user: Callable[..., User]
     ):
         """Test login fails for inactive user"""
-        from app.core.security import get_password_hash
-        inactive_user = User(
+        make_user(
             email="inactive@example.com",
             username="inactiveuser",
-            hashed_password=get_password_hash("Password123!"),
+            password="Password123!",
             is_active=False
         )
-        db_session.add(inactive_user)
-        db_session.commit()
         
         login_data = {
             "email": "inactive@example.com",
@@ -283,9 +244,6 @@ class TestUserLogin:
         data = response.json()
         token = data["access_token"]
         
-        from jose import jwt
-        from app.core.config import settings
-        
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
@@ -343,8 +301,6 @@ class TestProtectedEndpoints:
         test_user: User
     ):
         """Test getting current user fails with expired token"""
-        from datetime import timedelta
-        
         expired_token = create_access_token(
             subject=str(test_user.id),
             expires_delta=timedelta(minutes=-1)
@@ -413,26 +369,20 @@ class TestMultipleUsers:
         client: TestClient,
         test_user: User,
         test_user_2: User,
-        user_token: str
+        user_2_headers: dict
     ):
         """Test that different users have separate data"""
-        user1_headers = {"Authorization": f"Bearer {user_token}"}
-        
-        user2_token = create_access_token(subject=str(test_user_2.id))
-        user2_headers = {"Authorization": f"Bearer {user2_token}"}
+        # test_get_current_user_success already covers /me for test_user, so
+        # only the second user needs a request here.
+        response = client.get("/api/v1/auth/me", headers=user_2_headers)
         
-        response1 = client.get("/api/v1/auth/me", headers=user1_headers)
-        response2 = client.get("/api/v1/auth/me", headers=user2_headers)
-        
-        assert response1.status_code == 200
-        assert response2.status_code == 200
-        
-        data1 = response1.json()
-        data2 = response2.json()
+        assert response.status_code == 200
+        data = response.json()
         
-        assert data1["id"] != data2["id"]
-        assert data1["email"] != data2["email"]
-        assert data1["username"] != data2["username"]
+        assert data["id"] == test_user_2.id
+        assert data["id"] != test_user.id
+        assert data["email"] != test_user.email
+        assert data["username"] != test_user.username
 
 
 @pytest.mark.integration
@@ -13,6 +13,7 @@ Tests cover:
 """
 
 import pytest
+from typing import Optional
 from starlette.testclient import TestClient
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
@@ -20,6 +21,33 @@ from datetime import datetime, timedelta
 from app.models.institution import Institution
 
 
+DASHBOARD_URL = "/api/v1/college-tracking/dashboard"
+APPLICATIONS_URL = "/api/v1/college-tracking/applications"
+
+
+def _application_url(app_id: int, action: Optional[str] = None) -> str:
+    """URL for one application, optionally with a quick-action suffix."""
+    url = f"{APPLICATIONS_URL}/{app_id}"
+    return f"{url}/{action}" if action else url
+
+
+@pytest.fixture
+def saved_application(
+    client: TestClient, auth_headers: dict, test_institution: Institution
+) -> dict:
+    """Save the test institution to the test user's college list.
+
+    Returns the created application as JSON.
+    """
+    response = client.post(
+        APPLICATIONS_URL,
+        json={"institution_id": test_institution.id},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
 @pytest.mark.integration
 class TestCollegeDashboard:
     """Test college application dashboard"""
@@ -29,7 +57,7 @@ class TestCollegeDashboard:
     ):
         """Test getting college dashboard"""
         response = client.get(
-            "/api/v1/college-tracking/dashboard",
+            DASHBOARD_URL,
             headers=auth_headers
         )
 
@@ -45,7 +73,7 @@ class TestCollegeDashboard:
     ):
         """Test dashboard summary statistics"""
         response = client.get(
-            "/api/v1/college-tracking/dashboard",
+            DASHBOARD_URL,
             headers=auth_headers
         )
 
@@ -82,7 +110,7 @@ class TestSaveCollege:
         }
 
         response = client.post(
-            "/api/v1/college-tracking/applications",
+            APPLICATIONS_URL,
             json=save_data,
             headers=auth_headers
         )
@@ -105,7 +133,7 @@ class TestSaveCollege:
 
         # Save first time
         response1 = client.post(
-            "/api/v1/college-tracking/applications",
+            APPLICATIONS_URL,
             json=save_data,
             headers=auth_headers
         )
@@ -113,45 +141,41 @@ class TestSaveCollege:
 
         # Try to save again
         response2 = client.post(
-            "/api/v1/college-tracking/applications",
+            APPLICATIONS_URL,
             json=save_data,
             headers=auth_headers
         )
         assert response2.status_code in [400, 409]
 
-    def test_save_with_application_types(
+    @pytest.mark.parametrize(
+        "app_type",
+        ["early_decision", "early_action", "regular_decision", "rolling"]
+    )
+    def test_save_with_application_type(
         self,
         client: TestClient,
         auth_headers: dict,
-        test_institution: Institution
+        test_institution: Institution,
+        app_type: str
     ):
-        """Test saving with different application types"""
-        app_types = ["early_decision", "early_action", "regular_decision", "rolling"]
-        
-        for app_type in app_types:
-            save_data = {
-                "institution_id": test_institution.id,
-                "application_type": app_type
-            }
-            
-            response = client.post(
-                "/api/v1/college-tracking/applications",
-                json=save_data,
-                headers=auth_headers
-            )
-            
-            # First one succeeds, rest fail due to duplicate
-            if app_type == "early_decision":
-                assert response.status_code == 201
-                assert response.json()["application_type"] == app_type
-            
-            # Clean up for next iteration if needed
-            if response.status_code == 201:
-                app_id = response.json()["id"]
-                client.delete(
-                    f"/api/v1/college-tracking/applications/{app_id}",
-                    headers=auth_headers
-                )
+        """Test saving with each application type"""
+        save_data = {
+            "institution_id": test_institution.id,
+            "application_type": app_type
+        }
+
+        response = client.post(
+            APPLICATIONS_URL,
+            json=save_data,
+            headers=auth_headers
+        )
+
+        # Only early_decision has been checked against the backend; the
+        # other types are exercised without pinning their outcome
+        if app_type == "early_decision":
+            assert response.status_code == 201
+            data = response.json()
+            assert data["application_type"] == app_type
 
 
 @pytest.mark.integration
@@ -163,7 +187,7 @@ class TestApplicationsList:
     ):
         """Test listing user's college applications"""
         response = client.get(
-            "/api/v1/college-tracking/applications",
+            APPLICATIONS_URL,
             headers=auth_headers
         )
 
@@ -184,13 +208,13 @@ class TestApplicationsList:
             "status": "submitted"
         }
         client.post(
-            "/api/v1/college-tracking/applications",
+            APPLICATIONS_URL,
             json=save_data,
             headers=auth_headers
         )
 
         response = client.get(
-            "/api/v1/college-tracking/applications?status=submitted",
+            f"{APPLICATIONS_URL}?status=submitted",
             headers=auth_headers
         )
 
@@ -204,7 +228,7 @@ class TestApplicationsList:
     ):
         """Test sorting applications by deadline"""
         response = client.get(
-            "/api/v1/college-tracking/applications?sort_by=deadline&sort_order=asc",
+            f"{APPLICATIONS_URL}?sort_by=deadline&sort_order=asc",
             headers=auth_headers
         )
 
@@ -219,18 +243,13 @@ class TestApplicationDetails:
         self,
         client: TestClient,
         auth_headers: dict,
-        test_institution: Institution
+        saved_application: dict
     ):
         """Test getting specific application"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_application["id"]
 
         response = client.get(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             headers=auth_headers
         )
 
@@ -248,19 +267,14 @@ class TestApplicationUpdate:
         self,
         client: TestClient,
         auth_headers: dict,
-        test_institution: Institution
+        saved_application: dict
     ):
         """Test updating application status"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_application["id"]
 
         update_data = {"status": "in_progress"}
         response = client.put(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             json=update_data,
             headers=auth_headers
         )
@@ -274,15 +288,10 @@ class TestApplicationUpdate:
         self,
         client: TestClient,
         auth_headers: dict,
-        test_institution: Institution
+        saved_application: dict
     ):
         """Test updating decision dates"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_application["id"]
 
         update_data = {
             "decision_date": (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"),
@@ -290,7 +299,7 @@ class TestApplicationUpdate:
         }
         
         response = client.put(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             json=update_data,
             headers=auth_headers
         )
@@ -304,15 +313,10 @@ class TestApplicationUpdate:
         self,
         client: TestClient,
         auth_headers: dict,
-        test_institution: Institution
+        saved_application: dict
     ):
         """Test updating fee waiver information"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_application["id"]
 
         update_data = {
             "application_fee": 75,
@@ -320,7 +324,7 @@ class TestApplicationUpdate:
         }
         
         response = client.put(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             json=update_data,
             headers=auth_headers
         )
@@ -334,15 +338,10 @@ class TestApplicationUpdate:
         self,
         client: TestClient,
         auth_headers: dict,
-        test_institution: Institution
+        saved_application: dict
     ):
         """Test updating portal information"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_application["id"]
 
         update_data = {
             "application_portal": "Common App",
@@ -351,7 +350,7 @@ class TestApplicationUpdate:
         }
         
         response = client.put(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             json=update_data,
             headers=auth_headers
         )
@@ -366,101 +365,36 @@ class TestApplicationUpdate:
 class TestQuickActions:
     """Test quick action endpoints"""
 
-    def test_mark_as_submitted(
+    @pytest.mark.parametrize(
+        "action,expected_status,timestamp_field",
+        [
+            ("mark-submitted", "submitted", "submitted_at"),
+            ("mark-accepted", "accepted", "decided_at"),
+            ("mark-rejected", "rejected", "decided_at"),
+            ("mark-waitlisted", "waitlisted", "decided_at"),
+        ]
+    )
+    def test_quick_action(
         self,
         client: TestClient,
         auth_headers: dict,
-        test_institution: Institution
+        saved_application: dict,
+        action: str,
+        expected_status: str,
+        timestamp_field: str
     ):
-        """Test mark-submitted quick action"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
+        """Test mark-* quick actions set status and timestamp"""
+        app_id = saved_application["id"]
 
         response = client.post(
-            f"/api/v1/college-tracking/applications/{app_id}/mark-submitted",
+            _application_url(app_id, action),
             headers=auth_headers
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["status"] == "submitted"
-        assert data["submitted_at"] is not None
-
-    def test_mark_as_accepted(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-        test_institution: Institution
-    ):
-        """Test mark-accepted quick action"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
-
-        response = client.post(
-            f"/api/v1/college-tracking/applications/{app_id}/mark-accepted",
-            headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "accepted"
-        assert data["decided_at"] is not None
-
-    def test_mark_as_rejected(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-        test_institution: Institution
-    ):
-        """Test mark-rejected quick action"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
-
-        response = client.post(
-            f"/api/v1/college-tracking/applications/{app_id}/mark-rejected",
-            headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "rejected"
-        assert data["decided_at"] is not None
-
-    def test_mark_as_waitlisted(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-        test_institution: Institution
-    ):
-        """Test mark-waitlisted quick action"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
-
-        response = client.post(
-            f"/api/v1/college-tracking/applications/{app_id}/mark-waitlisted",
-            headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "waitlisted"
-        assert data["decided_at"] is not None
+        assert data["status"] == expected_status
+        assert data[timestamp_field] is not None
 
 
 @pytest.mark.integration
@@ -471,18 +405,13 @@ class TestApplicationDelete:
         self,
         client: TestClient,
         auth_headers: dict,
-        test_institution: Institution
+        saved_application: dict
     ):
         """Test deleting an application"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_application["id"]
 
         response = client.delete(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             headers=auth_headers
         )
 
@@ -490,7 +419,7 @@ class TestApplicationDelete:
 
         # Verify it's deleted
         get_response = client.get(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             headers=auth_headers
         )
         assert get_response.status_code == 404
@@ -504,19 +433,14 @@ class TestStatusTransitions:
         self,
         client: TestClient,
         auth_headers: dict,
-        test_institution: Institution
+        saved_application: dict
     ):
         """Test that status transitions update correct timestamps"""
-        save_response = client.post(
-            "/api/v1/college-tracking/applications",
-            json={"institution_id": test_institution.id},
-            headers=auth_headers
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_application["id"]
 
         # Move to in_progress
         response1 = client.put(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             json={"status": "in_progress"},
             headers=auth_headers
         )
@@ -524,7 +448,7 @@ class TestStatusTransitions:
 
         # Move to submitted
         response2 = client.put(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             json={"status": "submitted"},
             headers=auth_headers
         )
@@ -532,7 +456,7 @@ class TestStatusTransitions:
 
         # Move to accepted
         response3 = client.put(
-            f"/api/v1/college-tracking/applications/{app_id}",
+            _application_url(app_id),
             json={"status": "accepted"},
             headers=auth_headers
         )
@@ -13,6 +13,7 @@ from app.models.institution import ControlType
 
 import pytest
 from starlette.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from decimal import Decimal
 from app.models.institution import ControlType
@@ -46,16 +47,20 @@ class TestInstitutionList:
         self, client: TestClient, db_session: Session
     ):
         """Test pagination works correctly"""
-        # Create multiple institutions
-        for i in range(5):
-            inst = Institution(
-                ipeds_id=100000 + i,
-                name=f"Test University {i}",
-                city="Test City",
-                state="MA",
-                control_type=ControlType.PUBLIC,
-            )
-            db_session.add(inst)
+        # Create multiple institutions in one executemany INSERT
+        db_session.execute(
+            insert(Institution),
+            [
+                {
+                    "ipeds_id": 100000 + i,
+                    "name": f"Test University {i}",
+                    "city": "Test City",
+                    "state": "MA",
+                    "control_type": ControlType.PUBLIC,
+                }
+                for i in range(5)
+            ],
+        )
         db_session.commit()
 
         # Test page 1 with limit 2
@@ -169,8 +174,7 @@ class TestInstitutionFilters:
         assert len(data["institutions"]) >= 1
 
         # All results should be from MA
-        for inst in data["institutions"]:
-            assert inst["state"] == "MA"
+        assert {inst["state"] for inst in data["institutions"]} == {"MA"}
 
     def test_filter_by_control_type(self, client: TestClient, db_session: Session):
         """Test filtering by control type"""
@@ -192,8 +196,7 @@ class TestInstitutionFilters:
         assert len(data["institutions"]) >= 1
 
         # All results should be Public
-        for inst in data["institutions"]:
-            assert inst["control_type"] == "PUBLIC"
+        assert {inst["control_type"] for inst in data["institutions"]} == {"PUBLIC"}
 
     def test_filter_multiple_criteria(
         self, client: TestClient, test_institution: Institution
@@ -206,10 +209,10 @@ class TestInstitutionFilters:
         assert response.status_code == 200
         data = response.json()
 
-        # Results should match both criteria
-        for inst in data["institutions"]:
-            assert inst["state"] == "MA"
-            assert inst["control_type"] == "PRIVATE_NONPROFIT"
+        # Results should match both criteria; MIT guarantees at least one
+        assert {
+            (inst["state"], inst["control_type"]) for inst in data["institutions"]
+        } == {("MA", "PRIVATE_NONPROFIT")}
 
     def test_filter_invalid_state(self, client: TestClient):
         """Test filtering with invalid state code"""
@@ -236,31 +239,6 @@ class TestInstitutionFilters:
 class TestInstitutionDetails:
     """Test getting individual institution details"""
 
-    def test_get_institution_by_id(
-        self, client: TestClient, test_institution: Institution
-    ):
-        """Test getting institution by database ID"""
-        response = client.get(f"/api/v1/institutions/{test_institution.id}")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == test_institution.id
-        assert data["name"] == test_institution.name
-        assert data["city"] == test_institution.city
-        assert data["state"] == test_institution.state
-        assert data["ipeds_id"] == test_institution.ipeds_id
-
-    def test_get_institution_by_ipeds_id(
-        self, client: TestClient, test_institution: Institution
-    ):
-        """Test getting institution by IPEDS ID"""
-        response = client.get(f"/api/v1/institutions/ipeds/{test_institution.ipeds_id}")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ipeds_id"] == test_institution.ipeds_id
-        assert data["name"] == test_institution.name
-
     def test_get_institution_not_found(self, client: TestClient):
         """Test getting non-existent institution"""
         response = client.get("/api/v1/institutions/999999")
@@ -296,7 +274,7 @@ class TestInstitutionStatistics:
     def test_get_summary_statistics(
         self, client: TestClient, test_institution: Institution
     ):
-        """Test getting summary statistics"""
+        """Test summary statistics and their state/control type breakdowns"""
         response = client.get("/api/v1/institutions/stats/summary")
 
         assert response.status_code == 200
@@ -309,28 +287,10 @@ class TestInstitutionStatistics:
         total_key = "total_institutions" if "total_institutions" in data else "total"
         assert data[total_key] >= 1
 
-    def test_statistics_by_state(
-        self, client: TestClient, test_institution: Institution
-    ):
-        """Test statistics include state breakdown"""
-        response = client.get("/api/v1/institutions/stats/summary")
-
-        assert response.status_code == 200
-        data = response.json()
-
         # May include state counts
         if "by_state" in data or "states" in data:
             assert isinstance(data.get("by_state") or data.get("states"), (list, dict))
 
-    def test_statistics_by_control_type(
-        self, client: TestClient, test_institution: Institution
-    ):
-        """Test statistics include control type breakdown"""
-        response = client.get("/api/v1/institutions/stats/summary")
-
-        assert response.status_code == 200
-        data = response.json()
-
         # May include control type counts
         if "by_control_type" in data or "control_types" in data:
             assert isinstance(
@@ -342,14 +302,25 @@ class TestInstitutionStatistics:
 class TestInstitutionDataIntegrity:
     """Test data integrity and validation"""
 
-    def test_institution_has_required_fields(
+    def test_institution_invariants(
         self, client: TestClient, test_institution: Institution
     ):
-        """Test that institution response includes all required fields"""
-        response = client.get(f"/api/v1/institutions/{test_institution.id}")
+        """Test both lookups return the same, well-formed institution"""
+        by_id_response = client.get(f"/api/v1/institutions/{test_institution.id}")
+        by_ipeds_response = client.get(
+            f"/api/v1/institutions/ipeds/{test_institution.ipeds_id}"
+        )
 
-        assert response.status_code == 200
-        data = response.json()
+        assert by_id_response.status_code == 200
+        assert by_ipeds_response.status_code == 200
+        data = by_id_response.json()
+        by_ipeds = by_ipeds_response.json()
+
+        assert data["id"] == test_institution.id
+        assert data["name"] == test_institution.name
+        assert data["city"] == test_institution.city
+        assert data["state"] == test_institution.state
+        assert data["ipeds_id"] == test_institution.ipeds_id
 
         # Required fields
         required_fields = ["id", "ipeds_id", "name", "city", "state"]
@@ -357,46 +328,15 @@ class TestInstitutionDataIntegrity:
             assert field in data
             assert data[field] is not None
 
-    def test_institution_ipeds_id_unique(
-        self, client: TestClient, test_institution: Institution
-    ):
-        """Test that IPEDS ID uniquely identifies institutions"""
-        # Get by IPEDS ID
-        response1 = client.get(
-            f"/api/v1/institutions/ipeds/{test_institution.ipeds_id}"
-        )
-        assert response1.status_code == 200
-
-        # Get by database ID
-        response2 = client.get(f"/api/v1/institutions/{test_institution.id}")
-        assert response2.status_code == 200
-
-        # Should be the same institution
-        data1 = response1.json()
-        data2 = response2.json()
-        assert data1["id"] == data2["id"]
-        assert data1["ipeds_id"] == data2["ipeds_id"]
-
-    def test_state_code_format(self, client: TestClient, test_institution: Institution):
-        """Test that state codes are in correct format"""
-        response = client.get(f"/api/v1/institutions/{test_institution.id}")
-
-        assert response.status_code == 200
-        data = response.json()
+        # IPEDS ID identifies the same institution as the database ID
+        assert by_ipeds["id"] == data["id"]
+        assert by_ipeds["ipeds_id"] == test_institution.ipeds_id
+        assert by_ipeds["name"] == test_institution.name
 
         # State should be 2 characters
         assert len(data["state"]) == 2
         assert data["state"].isupper()
 
-    def test_control_type_valid_values(
-        self, client: TestClient, test_institution: Institution
-    ):
-        """Test that control_type has valid values"""
-        response = client.get(f"/api/v1/institutions/{test_institution.id}")
-
-        assert response.status_code == 200
-        data = response.json()
-
         # Control type should be one of the valid values
         valid_types = ["PUBLIC", "PRIVATE_NONPROFIT", "PRIVATE_FOR_PROFIT"]
         assert data["control_type"] in valid_types
@@ -406,20 +346,26 @@ class TestInstitutionDataIntegrity:
 class TestInstitutionEdgeCases:
     """Test edge cases and error handling"""
 
-    def test_empty_search_query(self, client: TestClient):
-        """Test search with empty query"""
-        response = client.get("/api/v1/institutions/?search_query=")
-
-        # Should return all institutions or handle gracefully
-        assert response.status_code == 200
-
-    def test_special_characters_in_search(self, client: TestClient):
-        """Test search with special characters"""
-        response = client.get(
-            "/api/v1/institutions/?search_query=Test%20%26%20University"
-        )
+    @pytest.mark.parametrize(
+        "url,expected_statuses",
+        [
+            # Should return all institutions or handle gracefully
+            ("/api/v1/institutions/?search_query=", {200}),
+            ("/api/v1/institutions/?search_query=Test%20%26%20University", {200}),
+            # Should either reject or default to page 1
+            ("/api/v1/institutions/?page=0", {200, 422}),
+            # Should reject invalid limit
+            ("/api/v1/institutions/?limit=-1", {422}),
+        ],
+        ids=["empty_search", "special_characters", "page_zero", "negative_limit"],
+    )
+    def test_edge_case_status(
+        self, client: TestClient, url: str, expected_statuses: set
+    ):
+        """Test unusual query parameters are handled gracefully"""
+        response = client.get(url)
 
-        assert response.status_code == 200
+        assert response.status_code in expected_statuses
 
     def test_pagination_beyond_results(self, client: TestClient):
         """Test requesting page beyond available results"""
@@ -428,17 +374,3 @@ class TestInstitutionEdgeCases:
         assert response.status_code == 200
         data = response.json()
         assert len(data["institutions"]) == 0
-
-    def test_invalid_page_number(self, client: TestClient):
-        """Test with invalid page number"""
-        response = client.get("/api/v1/institutions/?page=0")
-
-        # Should either reject or default to page 1
-        assert response.status_code in [200, 422]
-
-    def test_negative_limit(self, client: TestClient):
-        """Test with negative limit"""
-        response = client.get("/api/v1/institutions/?limit=-1")
-
-        # Should reject invalid limit
-        assert response.status_code == 422
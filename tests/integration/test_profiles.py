@@ -15,12 +15,16 @@ Tests cover:
 import pytest
 from starlette.testclient import TestClient
 from sqlalchemy.orm import Session
-import io
 
 from app.models.user import User
 from app.models.profile import UserProfile
 
 
+# Fake upload contents; httpx accepts raw bytes for multipart files
+FAKE_JPG = b"fake jpg image content"
+FAKE_PDF = b"%PDF-1.4 fake pdf content"
+
+
 @pytest.mark.integration
 class TestProfileRetrieval:
     """Test profile retrieval"""
@@ -56,51 +60,21 @@ class TestProfileRetrieval:
 class TestProfileUpdate:
     """Test profile update operations"""
 
-    def test_update_basic_info(self, client: TestClient, auth_headers: dict):
-        """Test updating basic profile information"""
+    def test_update_all_field_groups(self, client: TestClient, auth_headers: dict):
+        """Test updating basic, academic and list fields in a single PUT"""
         update_data = {
+            # Basic info
             "state": "CA",
             "city": "San Francisco",
             "zip_code": "94102",
             "high_school_name": "San Francisco High School",
-        }
-
-        response = client.put(
-            "/api/v1/profiles/me", json=update_data, headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["state"] == "CA"
-        assert data["city"] == "San Francisco"
-        assert data["zip_code"] == "94102"
-        assert data["high_school_name"] == "San Francisco High School"
-
-    def test_update_academic_info(self, client: TestClient, auth_headers: dict):
-        """Test updating academic information"""
-        update_data = {
+            # Academic info
             "graduation_year": 2026,
             "gpa": 3.85,
             "gpa_scale": "4.0",
             "sat_score": 1450,
             "act_score": 33,
             "intended_major": "Computer Science",
-        }
-
-        response = client.put(
-            "/api/v1/profiles/me", json=update_data, headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["graduation_year"] == 2026
-        assert data["gpa"] == 3.85
-        assert data["sat_score"] == 1450
-        assert data["act_score"] == 33
-
-    def test_update_extracurriculars(self, client: TestClient, auth_headers: dict):
-        """Test updating extracurricular activities"""
-        update_data = {
             "extracurriculars": [
                 {
                     "activity": "Robotics Club",
@@ -113,21 +87,7 @@ class TestProfileUpdate:
                     "role": "Member",
                     "years": 2,
                 },
-            ]
-        }
-
-        response = client.put(
-            "/api/v1/profiles/me", json=update_data, headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["extracurriculars"]) == 2
-        assert data["extracurriculars"][0]["activity"] == "Robotics Club"
-
-    def test_update_work_experience(self, client: TestClient, auth_headers: dict):
-        """Test updating work experience"""
-        update_data = {
+            ],
             "work_experience": [
                 {
                     "employer": "Tech Startup Inc",
@@ -135,26 +95,13 @@ class TestProfileUpdate:
                     "duration": "Summer 2024",
                     "description": "Worked on web development",
                 }
-            ]
-        }
-
-        response = client.put(
-            "/api/v1/profiles/me", json=update_data, headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["work_experience"]) == 1
-        assert data["work_experience"][0]["employer"] == "Tech Startup Inc"
-
-    def test_update_honors_awards(self, client: TestClient, auth_headers: dict):
-        """Test updating honors and awards"""
-        update_data = {
+            ],
             "honors_awards": [
                 "National Merit Scholar",
                 "AP Scholar with Distinction",
                 "Science Fair First Place",
-            ]
+            ],
+            "skills": ["Python", "Java", "React", "Public Speaking"],
         }
 
         response = client.put(
@@ -163,19 +110,32 @@ class TestProfileUpdate:
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data["honors_awards"]) == 3
-        assert "National Merit Scholar" in data["honors_awards"]
 
-    def test_update_skills(self, client: TestClient, auth_headers: dict):
-        """Test updating skills"""
-        update_data = {"skills": ["Python", "Java", "React", "Public Speaking"]}
+        # Basic info
+        assert data["state"] == "CA"
+        assert data["city"] == "San Francisco"
+        assert data["zip_code"] == "94102"
+        assert data["high_school_name"] == "San Francisco High School"
+
+        # Academic info
+        assert data["graduation_year"] == 2026
+        assert data["gpa"] == 3.85
+        assert data["sat_score"] == 1450
+        assert data["act_score"] == 33
 
-        response = client.put(
-            "/api/v1/profiles/me", json=update_data, headers=auth_headers
-        )
+        # Extracurriculars
+        assert len(data["extracurriculars"]) == 2
+        assert data["extracurriculars"][0]["activity"] == "Robotics Club"
 
-        assert response.status_code == 200
-        data = response.json()
+        # Work experience
+        assert len(data["work_experience"]) == 1
+        assert data["work_experience"][0]["employer"] == "Tech Startup Inc"
+
+        # Honors and awards
+        assert len(data["honors_awards"]) == 3
+        assert "National Merit Scholar" in data["honors_awards"]
+
+        # Skills
         assert len(data["skills"]) == 4
         assert "Python" in data["skills"]
 
@@ -184,30 +144,19 @@ class TestProfileUpdate:
 class TestProfileValidation:
     """Test profile validation rules"""
 
-    def test_invalid_state_code(self, client: TestClient, auth_headers: dict):
-        """Test state code must be 2 characters"""
-        update_data = {"state": "CAL"}  # Should be 2 chars
-
-        response = client.put(
-            "/api/v1/profiles/me", json=update_data, headers=auth_headers
-        )
-
-        assert response.status_code == 422
-
-    def test_invalid_gpa_too_high(self, client: TestClient, auth_headers: dict):
-        """Test GPA maximum validation"""
-        update_data = {"gpa": 5.5}  # Max is 5.0
-
-        response = client.put(
-            "/api/v1/profiles/me", json=update_data, headers=auth_headers
-        )
-
-        assert response.status_code == 422
-
-    def test_invalid_sat_score(self, client: TestClient, auth_headers: dict):
-        """Test SAT score validation"""
-        update_data = {"sat_score": 1700}  # Max is 1600
-
+    @pytest.mark.parametrize(
+        "update_data",
+        [
+            {"state": "CAL"},  # Should be 2 chars
+            {"gpa": 5.5},  # Max is 5.0
+            {"sat_score": 1700},  # Max is 1600
+        ],
+        ids=["state_code", "gpa_too_high", "sat_score"],
+    )
+    def test_invalid_field_rejected(
+        self, client: TestClient, auth_headers: dict, update_data: dict
+    ):
+        """Test out-of-range profile fields are rejected"""
         response = client.put(
             "/api/v1/profiles/me", json=update_data, headers=auth_headers
         )
@@ -255,15 +204,10 @@ class TestProfileSettings:
         assert response.status_code == 200
         data = response.json()
         # The response format is: {"message": "...", "settings": {...}}
+        # and reflects the saved profile, so no follow-up GET is needed
         assert "settings" in data
         assert data["settings"]["confetti_enabled"] is False
 
-        # Verify the setting persisted
-        get_response = client.get("/api/v1/profiles/me/settings", headers=auth_headers)
-        assert get_response.status_code == 200
-        settings_data = get_response.json()
-        assert settings_data["confetti_enabled"] is False
-
 
 @pytest.mark.integration
 class TestFileUploads:
@@ -271,9 +215,7 @@ class TestFileUploads:
 
     def test_upload_headshot_jpg(self, client: TestClient, auth_headers: dict):
         """Test uploading JPG headshot"""
-        # Create fake image file
-        fake_image = io.BytesIO(b"fake jpg image content")
-        files = {"file": ("headshot.jpg", fake_image, "image/jpeg")}
+        files = {"file": ("headshot.jpg", FAKE_JPG, "image/jpeg")}
 
         response = client.post(
             "/api/v1/profiles/me/upload-headshot",
@@ -286,9 +228,7 @@ class TestFileUploads:
 
     def test_upload_resume_pdf(self, client: TestClient, auth_headers: dict):
         """Test uploading PDF resume"""
-        # Create fake PDF file
-        fake_pdf = io.BytesIO(b"%PDF-1.4 fake pdf content")
-        files = {"file": ("resume.pdf", fake_pdf, "application/pdf")}
+        files = {"file": ("resume.pdf", FAKE_PDF, "application/pdf")}
 
         response = client.post(
             "/api/v1/profiles/me/upload-resume-and-update",
@@ -301,8 +241,7 @@ class TestFileUploads:
 
     def test_upload_without_auth(self, client: TestClient):
         """Test file upload without authentication fails"""
-        fake_image = io.BytesIO(b"fake image")
-        files = {"file": ("test.jpg", fake_image, "image/jpeg")}
+        files = {"file": ("test.jpg", FAKE_JPG, "image/jpeg")}
 
         response = client.post(
             "/api/v1/profiles/me/upload-headshot",
@@ -12,53 +12,98 @@ Tests cover:
 """
 
 import pytest
+from typing import Optional
+from datetime import datetime, timedelta
 from starlette.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
 
 from app.models.scholarship import Scholarship
 
 
-@pytest.mark.integration
+pytestmark = pytest.mark.integration
+
+DASHBOARD_URL = "/api/v1/scholarship-tracking/dashboard"
+APPLICATIONS_URL = "/api/v1/scholarship-tracking/applications"
+
+
+def _application_url(app_id: int, action: Optional[str] = None) -> str:
+    """Path of a tracked scholarship application, or of its mark-* action."""
+    if action is None:
+        return f"{APPLICATIONS_URL}/{app_id}"
+    return f"{APPLICATIONS_URL}/{app_id}/{action}"
+
+
+DASHBOARD_KEYS = frozenset({"summary", "upcoming_deadlines", "overdue", "applications"})
+DASHBOARD_SUMMARY_KEYS = frozenset(
+    {
+        "total_applications",
+        "interested",
+        "planning",
+        "in_progress",
+        "submitted",
+        "accepted",
+        "rejected",
+        "not_pursuing",
+        "total_potential_value",
+        "total_awarded_value",
+    }
+)
+
+
+@pytest.fixture
+def saved_scholarship_application(
+    client: TestClient, auth_headers: dict, test_scholarship: Scholarship
+) -> dict:
+    """Track the test scholarship for the test user.
+
+    Returns the created application as JSON.
+    """
+    response = client.post(
+        APPLICATIONS_URL,
+        json={"scholarship_id": test_scholarship.id},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
 class TestScholarshipDashboard:
     """Test scholarship dashboard"""
 
     def test_get_dashboard(self, client: TestClient, auth_headers: dict):
         """Test getting scholarship dashboard"""
-        response = client.get(
-            "/api/v1/scholarship-tracking/dashboard", headers=auth_headers
-        )
+        response = client.get(DASHBOARD_URL, headers=auth_headers)
 
         assert response.status_code == 200
-        data = response.json()
-        assert "summary" in data
-        assert "upcoming_deadlines" in data
-        assert "overdue" in data
-        assert "applications" in data
+        assert DASHBOARD_KEYS <= response.json().keys()
 
     def test_dashboard_summary_stats(self, client: TestClient, auth_headers: dict):
         """Test dashboard summary statistics"""
-        response = client.get(
-            "/api/v1/scholarship-tracking/dashboard", headers=auth_headers
-        )
+        response = client.get(DASHBOARD_URL, headers=auth_headers)
 
         assert response.status_code == 200
-        data = response.json()
-        summary = data["summary"]
+        summary = response.json()["summary"]
+        assert DASHBOARD_SUMMARY_KEYS <= summary.keys()
+
+    # The dashboard does not emit an ETag yet; headers["etag"] raises
+    # KeyError until it does, and any other failure still fails the test.
+    @pytest.mark.xfail(raises=KeyError, reason="dashboard has no ETag support yet")
+    def test_dashboard_etag_roundtrip(self, client: TestClient, auth_headers: dict):
+        """Test dashboard answers a matching If-None-Match with 304"""
+        response = client.get(DASHBOARD_URL, headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        cached_response = client.get(
+            DASHBOARD_URL,
+            headers={**auth_headers, "If-None-Match": etag},
+        )
 
-        assert "total_applications" in summary
-        assert "interested" in summary
-        assert "planning" in summary
-        assert "in_progress" in summary
-        assert "submitted" in summary
-        assert "accepted" in summary
-        assert "rejected" in summary
-        assert "not_pursuing" in summary
-        assert "total_potential_value" in summary
-        assert "total_awarded_value" in summary
+        assert cached_response.status_code == 304
+        assert cached_response.content == b""
 
 
-@pytest.mark.integration
 class TestSaveScholarship:
     """Test saving/bookmarking scholarships"""
 
@@ -73,7 +118,7 @@ class TestSaveScholarship:
         }
 
         response = client.post(
-            "/api/v1/scholarship-tracking/applications",
+            APPLICATIONS_URL,
             json=save_data,
             headers=auth_headers,
         )
@@ -92,7 +137,7 @@ class TestSaveScholarship:
 
         # Save first time
         response1 = client.post(
-            "/api/v1/scholarship-tracking/applications",
+            APPLICATIONS_URL,
             json=save_data,
             headers=auth_headers,
         )
@@ -100,7 +145,7 @@ class TestSaveScholarship:
 
         # Try to save again
         response2 = client.post(
-            "/api/v1/scholarship-tracking/applications",
+            APPLICATIONS_URL,
             json=save_data,
             headers=auth_headers,
         )
@@ -113,7 +158,7 @@ class TestSaveScholarship:
         save_data = {"scholarship_id": 999999}
 
         response = client.post(
-            "/api/v1/scholarship-tracking/applications",
+            APPLICATIONS_URL,
             json=save_data,
             headers=auth_headers,
         )
@@ -121,109 +166,142 @@ class TestSaveScholarship:
         assert response.status_code in [400, 404]  # API may return 400 or 404
 
 
-@pytest.mark.integration
 class TestApplicationsList:
     """Test listing scholarship applications"""
 
-    def test_list_applications(self, client: TestClient, auth_headers: dict):
-        """Test listing user's scholarship applications"""
-        response = client.get(
-            "/api/v1/scholarship-tracking/applications", headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-
-    def test_filter_by_status(
+    @pytest.mark.parametrize(
+        "params",
+        [{}, {"status": "submitted"}],
+        ids=["all", "filter_by_status"],
+    )
+    def test_list_applications(
         self,
         client: TestClient,
         auth_headers: dict,
         test_scholarship: Scholarship,
-        db_session: Session,
+        params: dict,
     ):
-        """Test filtering applications by status"""
-        # Save scholarship
-        save_data = {"scholarship_id": test_scholarship.id, "status": "submitted"}
-        client.post(
-            "/api/v1/scholarship-tracking/applications",
-            json=save_data,
+        """Test listing and filtering the user's applications"""
+        # Save one submitted scholarship so every variant has a row to return
+        save_response = client.post(
+            APPLICATIONS_URL,
+            json={"scholarship_id": test_scholarship.id, "status": "submitted"},
             headers=auth_headers,
         )
+        assert save_response.status_code == 201
 
         response = client.get(
-            "/api/v1/scholarship-tracking/applications?status=submitted",
+            APPLICATIONS_URL,
+            params=params,
             headers=auth_headers,
         )
 
         assert response.status_code == 200
         data = response.json()
-        for app in data:
-            assert app["status"] == "submitted"
+        assert isinstance(data, list)
+        assert [app["status"] for app in data] == ["submitted"]
+
+    def test_sort_applications_by_deadline(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        db_session: Session,
+        test_scholarship: Scholarship,
+    ):
+        """Test applications sort by scholarship deadline ascending"""
+        # Due before test_scholarship (60 days out) but saved after it, so
+        # save order and deadline order disagree
+        sooner_id = db_session.execute(
+            insert(Scholarship).returning(Scholarship.id),
+            {
+                "title": "Sooner Deadline Scholarship",
+                "organization": "Test Org",
+                "scholarship_type": "academic_merit",
+                "amount_min": 1000,
+                "amount_max": 5000,
+                "deadline": datetime.now() + timedelta(days=30),
+            },
+        ).scalar_one()
+
+        for scholarship_id in (test_scholarship.id, sooner_id):
+            save_response = client.post(
+                APPLICATIONS_URL,
+                json={"scholarship_id": scholarship_id},
+                headers=auth_headers,
+            )
+            assert save_response.status_code == 201
 
-    def test_sort_by_deadline(self, client: TestClient, auth_headers: dict):
-        """Test sorting applications by deadline"""
         response = client.get(
-            "/api/v1/scholarship-tracking/applications?sort_by=deadline&sort_order=asc",
+            APPLICATIONS_URL,
+            params={"sort_by": "deadline", "sort_order": "asc"},
             headers=auth_headers,
         )
 
         assert response.status_code == 200
+        data = response.json()
+        assert [app["scholarship_id"] for app in data] == [
+            sooner_id,
+            test_scholarship.id,
+        ]
 
 
-@pytest.mark.integration
 class TestApplicationDetails:
     """Test getting application details"""
 
     def test_get_application_by_id(
-        self, client: TestClient, auth_headers: dict, test_scholarship: Scholarship
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        saved_scholarship_application: dict,
     ):
         """Test getting specific application"""
-        # Save scholarship first
-        save_response = client.post(
-            "/api/v1/scholarship-tracking/applications",
-            json={"scholarship_id": test_scholarship.id},
-            headers=auth_headers,
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_scholarship_application["id"]
 
-        response = client.get(
-            f"/api/v1/scholarship-tracking/applications/{app_id}", headers=auth_headers
-        )
+        response = client.get(_application_url(app_id), headers=auth_headers)
 
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == app_id
 
     def test_get_other_user_application_fails(
-        self, client: TestClient, auth_headers: dict, test_user_2: dict
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        user_2_headers: dict,
+        test_scholarship: Scholarship,
     ):
         """Test cannot access other user's applications"""
-        # This would require creating an application as test_user_2
-        # and trying to access it as test_user
-        pass
+        # Create an application as test_user_2
+        save_response = client.post(
+            APPLICATIONS_URL,
+            json={"scholarship_id": test_scholarship.id},
+            headers=user_2_headers,
+        )
+        assert save_response.status_code == 201
+        app_id = save_response.json()["id"]
+
+        # test_user must not be able to read it
+        response = client.get(_application_url(app_id), headers=auth_headers)
+
+        assert response.status_code in [403, 404]
 
 
-@pytest.mark.integration
 class TestApplicationUpdate:
     """Test updating scholarship applications"""
 
     def test_update_application_status(
-        self, client: TestClient, auth_headers: dict, test_scholarship: Scholarship
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        saved_scholarship_application: dict,
     ):
         """Test updating application status"""
-        # Save scholarship
-        save_response = client.post(
-            "/api/v1/scholarship-tracking/applications",
-            json={"scholarship_id": test_scholarship.id},
-            headers=auth_headers,
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_scholarship_application["id"]
 
         # Update status
         update_data = {"status": "in_progress"}
         response = client.put(
-            f"/api/v1/scholarship-tracking/applications/{app_id}",
+            _application_url(app_id),
             json=update_data,
             headers=auth_headers,
         )
@@ -234,19 +312,17 @@ class TestApplicationUpdate:
         assert data["started_at"] is not None
 
     def test_update_notes(
-        self, client: TestClient, auth_headers: dict, test_scholarship: Scholarship
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        saved_scholarship_application: dict,
     ):
         """Test updating application notes"""
-        save_response = client.post(
-            "/api/v1/scholarship-tracking/applications",
-            json={"scholarship_id": test_scholarship.id},
-            headers=auth_headers,
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_scholarship_application["id"]
 
         update_data = {"notes": "Updated notes about this scholarship"}
         response = client.put(
-            f"/api/v1/scholarship-tracking/applications/{app_id}",
+            _application_url(app_id),
             json=update_data,
             headers=auth_headers,
         )
@@ -256,98 +332,64 @@ class TestApplicationUpdate:
         assert data["notes"] == "Updated notes about this scholarship"
 
 
-@pytest.mark.integration
 class TestQuickActions:
     """Test quick action endpoints"""
 
-    def test_mark_as_submitted(
-        self, client: TestClient, auth_headers: dict, test_scholarship: Scholarship
-    ):
-        """Test mark-submitted quick action"""
-        save_response = client.post(
-            "/api/v1/scholarship-tracking/applications",
-            json={"scholarship_id": test_scholarship.id},
-            headers=auth_headers,
-        )
-        app_id = save_response.json()["id"]
-
-        response = client.post(
-            f"/api/v1/scholarship-tracking/applications/{app_id}/mark-submitted",
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "submitted"
-        assert data["submitted_at"] is not None
-
-    def test_mark_as_accepted(
-        self, client: TestClient, auth_headers: dict, test_scholarship: Scholarship
-    ):
-        """Test mark-accepted quick action"""
-        save_response = client.post(
-            "/api/v1/scholarship-tracking/applications",
-            json={"scholarship_id": test_scholarship.id},
-            headers=auth_headers,
-        )
-        app_id = save_response.json()["id"]
-
-        response = client.post(
-            f"/api/v1/scholarship-tracking/applications/{app_id}/mark-accepted?award_amount=5000",
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "accepted"
-        assert data["decision_date"] is not None
-        assert data["award_amount"] == 5000
-
-    def test_mark_as_rejected(
-        self, client: TestClient, auth_headers: dict, test_scholarship: Scholarship
+    @pytest.mark.parametrize(
+        "action,params,timestamp_field,expected",
+        [
+            ("mark-submitted", {}, "submitted_at", {"status": "submitted"}),
+            (
+                "mark-accepted",
+                {"award_amount": 5000},
+                "decision_date",
+                {"status": "accepted", "award_amount": 5000},
+            ),
+            ("mark-rejected", {}, "decision_date", {"status": "rejected"}),
+        ],
+    )
+    def test_quick_action(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        saved_scholarship_application: dict,
+        action: str,
+        params: dict,
+        timestamp_field: str,
+        expected: dict,
     ):
-        """Test mark-rejected quick action"""
-        save_response = client.post(
-            "/api/v1/scholarship-tracking/applications",
-            json={"scholarship_id": test_scholarship.id},
-            headers=auth_headers,
-        )
-        app_id = save_response.json()["id"]
+        """Test mark-* quick actions set status and timestamp"""
+        app_id = saved_scholarship_application["id"]
 
         response = client.post(
-            f"/api/v1/scholarship-tracking/applications/{app_id}/mark-rejected",
+            _application_url(app_id, action),
+            params=params,
             headers=auth_headers,
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["status"] == "rejected"
-        assert data["decision_date"] is not None
+        assert data[timestamp_field] is not None
+        for field, value in expected.items():
+            assert data[field] == value
 
 
-@pytest.mark.integration
 class TestApplicationDelete:
     """Test deleting scholarship applications"""
 
     def test_delete_application(
-        self, client: TestClient, auth_headers: dict, test_scholarship: Scholarship
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        saved_scholarship_application: dict,
     ):
         """Test deleting an application"""
-        save_response = client.post(
-            "/api/v1/scholarship-tracking/applications",
-            json={"scholarship_id": test_scholarship.id},
-            headers=auth_headers,
-        )
-        app_id = save_response.json()["id"]
+        app_id = saved_scholarship_application["id"]
 
-        response = client.delete(
-            f"/api/v1/scholarship-tracking/applications/{app_id}", headers=auth_headers
-        )
+        response = client.delete(_application_url(app_id), headers=auth_headers)
 
         assert response.status_code == 204
 
         # Verify it's deleted
-        get_response = client.get(
-            f"/api/v1/scholarship-tracking/applications/{app_id}", headers=auth_headers
-        )
+        get_response = client.get(_application_url(app_id), headers=auth_headers)
         assert get_response.status_code == 404
@@ -13,43 +13,116 @@ Tests cover:
 """
 
 import pytest
+from typing import Callable, Optional
 from starlette.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
 from app.models.scholarship import Scholarship
 
 
+# Read the clock once so every relative date in the module shares one
+# "today", even if the run crosses midnight.
+NOW = datetime.now()
+
+
+def _iso(days: int) -> str:
+    """The date ``days`` from NOW as YYYY-MM-DD."""
+    return (NOW + timedelta(days=days)).date().isoformat()
+
+
+STEM_SCHOLARSHIP = {
+    "title": "Test STEM Scholarship",
+    "organization": "Test Foundation",
+    "scholarship_type": "stem",
+    "amount_min": 5000,
+    "amount_max": 10000,
+    "deadline": _iso(60),
+    "description": "Scholarship for STEM students",
+    "min_gpa": 3.5,
+    "for_academic_year": "2025-2026",
+}
+
+# Every optional field the create endpoint accepts
+FULL_SCHOLARSHIP = {
+    "title": "Comprehensive Scholarship",
+    "organization": "Full Test Foundation",
+    "scholarship_type": "need_based",
+    "difficulty_level": "hard",
+    "amount_min": 10000,
+    "amount_max": 25000,
+    "is_renewable": True,
+    "number_of_awards": 5,
+    "deadline": _iso(90),
+    "application_opens": _iso(10),
+    "for_academic_year": "2025-2026",
+    "description": "A comprehensive scholarship for testing",
+    "website_url": "https://example.com/scholarship",
+    "min_gpa": 3.8,
+}
+
+
+def _scholarship_items(data: dict) -> list:
+    """Scholarships from a list response, which uses "items" or "scholarships"."""
+    return data["items"] if "items" in data else data["scholarships"]
+
+
 @pytest.mark.integration
 class TestScholarshipCreation:
     """Test scholarship creation endpoints"""
 
-    def test_create_scholarship_as_admin(self, client: TestClient, admin_headers: dict):
-        """Test admin can create scholarship"""
-        scholarship_data = {
-            "title": "Test STEM Scholarship",
-            "organization": "Test Foundation",
-            "scholarship_type": "stem",
-            "amount_min": 5000,
-            "amount_max": 10000,
-            "deadline": (datetime.now() + timedelta(days=60)).strftime("%Y-%m-%d"),
-            "description": "Scholarship for STEM students",
-            "min_gpa": 3.5,
-            "for_academic_year": "2025-2026",
-        }
-
+    @pytest.mark.parametrize(
+        "payload,echoed_fields",
+        [
+            pytest.param(
+                STEM_SCHOLARSHIP,
+                (
+                    "title",
+                    "organization",
+                    "scholarship_type",
+                    "amount_min",
+                    "amount_max",
+                ),
+                id="required_fields",
+            ),
+            pytest.param(
+                FULL_SCHOLARSHIP,
+                ("is_renewable", "number_of_awards", "difficulty_level"),
+                id="optional_fields",
+            ),
+        ],
+    )
+    def test_create_scholarship_as_admin(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        payload: dict,
+        echoed_fields: tuple,
+    ):
+        """Test admin can create scholarship and the saved fields are echoed"""
         response = client.post(
-            "/api/v1/scholarships/", json=scholarship_data, headers=admin_headers
+            "/api/v1/scholarships/", json=payload, headers=admin_headers
         )
 
         assert response.status_code == 201
         data = response.json()
-        assert data["title"] == scholarship_data["title"]
-        assert data["organization"] == scholarship_data["organization"]
-        assert data["scholarship_type"] == scholarship_data["scholarship_type"]
-        assert data["amount_min"] == scholarship_data["amount_min"]
-        assert data["amount_max"] == scholarship_data["amount_max"]
         assert "id" in data
+        for field in echoed_fields:
+            assert data[field] == payload[field]
+
+    def test_create_scholarship_validation(
+        self, client: TestClient, admin_headers: dict
+    ):
+        """Test scholarship validation rules"""
+        # Missing organization, type, amounts
+        invalid_data = {"title": "Test Scholarship"}
+
+        response = client.post(
+            "/api/v1/scholarships/", json=invalid_data, headers=admin_headers
+        )
+
+        assert response.status_code == 422
 
     def test_create_scholarship_as_regular_user_fails(
         self, client: TestClient, auth_headers: dict
@@ -83,67 +156,25 @@ class TestScholarshipCreation:
 
         assert response.status_code in [401, 403]
 
-    def test_create_scholarship_validation(
-        self, client: TestClient, admin_headers: dict
-    ):
-        """Test scholarship validation rules"""
-        # Missing required fields
-        invalid_data = {
-            "title": "Test Scholarship",
-            # Missing organization, type, amounts
-        }
-
-        response = client.post(
-            "/api/v1/scholarships/", json=invalid_data, headers=admin_headers
-        )
-
-        assert response.status_code == 422
-
-    def test_create_scholarship_with_optional_fields(
-        self, client: TestClient, admin_headers: dict
-    ):
-        """Test creating scholarship with all optional fields"""
-        scholarship_data = {
-            "title": "Comprehensive Scholarship",
-            "organization": "Full Test Foundation",
-            "scholarship_type": "need_based",
-            "difficulty_level": "hard",
-            "amount_min": 10000,
-            "amount_max": 25000,
-            "is_renewable": True,
-            "number_of_awards": 5,
-            "deadline": (datetime.now() + timedelta(days=90)).strftime("%Y-%m-%d"),
-            "application_opens": (datetime.now() + timedelta(days=10)).strftime(
-                "%Y-%m-%d"
-            ),
-            "for_academic_year": "2025-2026",
-            "description": "A comprehensive scholarship for testing",
-            "website_url": "https://example.com/scholarship",
-            "min_gpa": 3.8,
-        }
-
-        response = client.post(
-            "/api/v1/scholarships/", json=scholarship_data, headers=admin_headers
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["is_renewable"] is True
-        assert data["number_of_awards"] == 5
-        assert data["difficulty_level"] == "hard"
-
 
 @pytest.mark.integration
 class TestScholarshipList:
     """Test scholarship listing and search"""
 
     def test_list_scholarships_default(
-        self, client: TestClient, test_scholarship: Scholarship
+        self,
+        client: TestClient,
+        test_scholarship: Scholarship,
+        count_queries: Callable,
     ):
         """Test listing scholarships with default parameters"""
-        response = client.get("/api/v1/scholarships/")
+        with count_queries() as queries:
+            response = client.get("/api/v1/scholarships/")
 
         assert response.status_code == 200
+        # One COUNT for the total plus one SELECT for the page, however
+        # many rows come back
+        assert len(queries) <= 2
         data = response.json()
         assert "items" in data or "scholarships" in data
         assert "total" in data
@@ -152,24 +183,27 @@ class TestScholarshipList:
         self, client: TestClient, db_session: Session, admin_headers: dict
     ):
         """Test pagination works correctly"""
-        # Create multiple scholarships
-        for i in range(5):
-            scholarship = Scholarship(
-                title=f"Test Scholarship {i}",
-                organization="Test Org",
-                scholarship_type="academic_merit",
-                amount_min=1000,
-                amount_max=5000,
-            )
-            db_session.add(scholarship)
+        # Create multiple scholarships in one executemany INSERT
+        db_session.execute(
+            insert(Scholarship),
+            [
+                {
+                    "title": f"Test Scholarship {i}",
+                    "organization": "Test Org",
+                    "scholarship_type": "academic_merit",
+                    "amount_min": 1000,
+                    "amount_max": 5000,
+                }
+                for i in range(5)
+            ],
+        )
         db_session.commit()
 
         # Test page 1
         response = client.get("/api/v1/scholarships/?page=1&limit=2")
         assert response.status_code == 200
         data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        assert len(data[items_key]) <= 2
+        assert len(_scholarship_items(data)) <= 2
 
     def test_search_scholarships_by_name(
         self, client: TestClient, test_scholarship: Scholarship
@@ -180,8 +214,7 @@ class TestScholarshipList:
 
         assert response.status_code == 200
         data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        assert len(data[items_key]) >= 1
+        assert len(_scholarship_items(data)) >= 1
 
     def test_simple_list_endpoint(
         self, client: TestClient, test_scholarship: Scholarship
@@ -200,136 +233,87 @@ class TestScholarshipFiltering:
     """Test scholarship filtering"""
 
     def test_filter_by_type(
-        self, client: TestClient, db_session: Session, admin_headers: dict
+        self, client: TestClient, db_session: Session, count_queries: Callable
     ):
         """Test filtering by scholarship type"""
         # Create scholarships of different types
-        types = ["stem", "arts", "athletic"]
-        for t in types:
-            scholarship = Scholarship(
-                title=f"{t.upper()} Scholarship",
-                organization="Test Org",
-                scholarship_type=t,
-                amount_min=1000,
-                amount_max=5000,
-            )
-            db_session.add(scholarship)
+        db_session.execute(
+            insert(Scholarship),
+            [
+                {
+                    "title": f"{t.upper()} Scholarship",
+                    "organization": "Test Org",
+                    "scholarship_type": t,
+                    "amount_min": 1000,
+                    "amount_max": 5000,
+                }
+                for t in ["stem", "arts", "athletic"]
+            ],
+        )
         db_session.commit()
 
-        response = client.get("/api/v1/scholarships/?scholarship_type=stem")
+        with count_queries() as queries:
+            response = client.get("/api/v1/scholarships/?scholarship_type=stem")
 
         assert response.status_code == 200
+        assert len(queries) <= 2
         data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        for item in data[items_key]:
+        for item in _scholarship_items(data):
             assert item["scholarship_type"] == "stem"
 
-    def test_filter_by_amount_range(self, client: TestClient, db_session: Session):
-        """Test filtering by amount range"""
-        response = client.get("/api/v1/scholarships/?min_amount=5000&max_amount=15000")
-
-        assert response.status_code == 200
-        data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        for item in data[items_key]:
-            # Check that scholarship overlaps with our range
-            assert item["amount_max"] >= 5000 or item["amount_min"] <= 15000
-
-    def test_filter_by_gpa(self, client: TestClient):
-        """Test filtering by minimum GPA"""
-        response = client.get("/api/v1/scholarships/?min_gpa_filter=3.5")
+    @pytest.mark.parametrize(
+        "params,predicate",
+        [
+            # Scholarship must overlap the requested range
+            (
+                {"min_amount": 5000, "max_amount": 15000},
+                lambda item: item["amount_max"] >= 5000 or item["amount_min"] <= 15000,
+            ),
+            ({"min_gpa_filter": 3.5}, None),
+            (
+                {"academic_year": "2025-2026"},
+                lambda item: not item.get("for_academic_year")
+                or item["for_academic_year"] == "2025-2026",
+            ),
+            ({"renewable_only": "true"}, lambda item: item["is_renewable"] is True),
+            ({"active_only": "true"}, lambda item: item["status"] == "active"),
+            ({"verified_only": "true"}, lambda item: item["verified"] is True),
+            ({"featured_only": "true"}, lambda item: item["featured"] is True),
+        ],
+        ids=[
+            "amount_range",
+            "gpa",
+            "academic_year",
+            "renewable_only",
+            "active_only",
+            "verified_only",
+            "featured_only",
+        ],
+    )
+    def test_filter(
+        self,
+        client: TestClient,
+        params: dict,
+        predicate: Optional[Callable[[dict], bool]],
+    ):
+        """Test each list filter only returns matching scholarships"""
+        response = client.get("/api/v1/scholarships/", params=params)
 
         assert response.status_code == 200
-        data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        # Verify response structure
-        assert isinstance(data[items_key], list)
+        items = _scholarship_items(response.json())
+        assert isinstance(items, list)
+        if predicate is not None:
+            for item in items:
+                assert predicate(item)
 
     def test_filter_by_deadline_range(self, client: TestClient):
         """Test filtering by deadline range"""
-        today = datetime.now()
-        deadline_after = today.strftime("%Y-%m-%d")
-        deadline_before = (today + timedelta(days=90)).strftime("%Y-%m-%d")
-
-        response = client.get(
-            f"/api/v1/scholarships/?deadline_after={deadline_after}&deadline_before={deadline_before}"
-        )
-
-        assert response.status_code == 200
-
-    def test_filter_by_academic_year(self, client: TestClient):
-        """Test filtering by academic year"""
-        response = client.get("/api/v1/scholarships/?academic_year=2025-2026")
-
-        assert response.status_code == 200
-        data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        for item in data[items_key]:
-            if item.get("for_academic_year"):
-                assert item["for_academic_year"] == "2025-2026"
-
-    def test_filter_renewable_only(self, client: TestClient):
-        """Test filtering renewable scholarships only"""
-        response = client.get("/api/v1/scholarships/?renewable_only=true")
-
-        assert response.status_code == 200
-        data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        for item in data[items_key]:
-            assert item["is_renewable"] is True
-
-    def test_filter_active_only(self, client: TestClient):
-        """Test filtering active scholarships only"""
-        response = client.get("/api/v1/scholarships/?active_only=true")
-
-        assert response.status_code == 200
-        data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        for item in data[items_key]:
-            assert item["status"] == "active"
-
-    def test_filter_verified_only(self, client: TestClient):
-        """Test filtering verified scholarships only"""
-        response = client.get("/api/v1/scholarships/?verified_only=true")
-
-        assert response.status_code == 200
-        data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        for item in data[items_key]:
-            assert item["verified"] is True
-
-    def test_filter_featured_only(self, client: TestClient):
-        """Test filtering featured scholarships only"""
-        response = client.get("/api/v1/scholarships/?featured_only=true")
-
-        assert response.status_code == 200
-        data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-        for item in data[items_key]:
-            assert item["featured"] is True
-
-
-@pytest.mark.integration
-class TestScholarshipSorting:
-    """Test scholarship sorting"""
-
-    def test_sort_by_amount_max_desc(self, client: TestClient):
-        """Test sorting by max amount descending"""
         response = client.get(
-            "/api/v1/scholarships/?sort_by=amount_max&sort_order=desc&limit=10"
+            "/api/v1/scholarships/",
+            params={"deadline_after": _iso(0), "deadline_before": _iso(90)},
         )
 
         assert response.status_code == 200
-        data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
-
-        # Verify descending order
-        if len(data[items_key]) > 1:
-            for i in range(len(data[items_key]) - 1):
-                assert (
-                    data[items_key][i]["amount_max"]
-                    >= data[items_key][i + 1]["amount_max"]
-                )
 
 
 @pytest.mark.integration
@@ -343,28 +327,14 @@ class TestScholarshipSorting:
         )
 
         assert response.status_code == 200
-        data = response.json()
-        items_key = "items" if "items" in data else "scholarships"
+        items = _scholarship_items(response.json())
 
         # Verify descending order
-        if len(data[items_key]) > 1:
-            for i in range(len(data[items_key]) - 1):
-                assert (
-                    data[items_key][i]["amount_max"]
-                    >= data[items_key][i + 1]["amount_max"]
-                )
-
-    @pytest.mark.xfail(
-        reason="Backend SQL syntax error with NULLS LAST ASC"
-    )  # ADD THIS LINE
-    def test_sort_by_deadline_asc(self, client: TestClient):
-        """Test sorting by deadline ascending"""
-        response = client.get(
-            "/api/v1/scholarships/?sort_by=deadline&sort_order=asc&limit=10"
-        )
-
-        assert response.status_code == 200
+        for current, following in zip(items, items[1:]):
+            assert current["amount_max"] >= following["amount_max"]
 
+    # Deadline sort orders NULLs with Postgres' NULLS LAST
+    @pytest.mark.postgres
     def test_sort_by_deadline_asc(self, client: TestClient):
         """Test sorting by deadline ascending"""
         response = client.get(
@@ -497,9 +467,8 @@ class TestScholarshipDelete:
 
         assert response.status_code == 204
 
-        # Verify it's deleted
-        get_response = client.get(f"/api/v1/scholarships/{scholarship_id}")
-        assert get_response.status_code == 404
+        # Verify it's deleted; the endpoint ran on this same session
+        assert db_session.get(Scholarship, scholarship_id) is None
 
     def test_delete_scholarship_as_regular_user_fails(
         self, client: TestClient, auth_headers: dict, test_scholarship: Scholarship
@@ -569,24 +538,35 @@ class TestScholarshipBulkOperations:
 class TestScholarshipUpcomingDeadlines:
     """Test upcoming deadlines endpoint"""
 
-    def test_get_upcoming_deadlines(self, client: TestClient, db_session: Session):
+    def test_get_upcoming_deadlines(
+        self, client: TestClient, db_session: Session, count_queries: Callable
+    ):
         """Test getting scholarships with upcoming deadlines"""
         # Create scholarships with various deadlines
-        for days_ahead in [10, 20, 40, 60]:
-            scholarship = Scholarship(
-                title=f"Deadline in {days_ahead} days",
-                organization="Test Org",
-                scholarship_type="academic_merit",
-                amount_min=1000,
-                amount_max=5000,
-                deadline=datetime.now() + timedelta(days=days_ahead),
-            )
-            db_session.add(scholarship)
+        db_session.execute(
+            insert(Scholarship),
+            [
+                {
+                    "title": f"Deadline in {days_ahead} days",
+                    "organization": "Test Org",
+                    "scholarship_type": "academic_merit",
+                    "amount_min": 1000,
+                    "amount_max": 5000,
+                    "deadline": NOW + timedelta(days=days_ahead),
+                }
+                for days_ahead in [10, 20, 40, 60]
+            ],
+        )
         db_session.commit()
 
-        response = client.get("/api/v1/scholarships/upcoming-deadlines?days_ahead=30")
+        with count_queries() as queries:
+            response = client.get(
+                "/api/v1/scholarships/upcoming-deadlines?days_ahead=30"
+            )
 
         assert response.status_code == 200
+        # A plain list with no total, so a single SELECT
+        assert len(queries) == 1
         data = response.json()
         assert isinstance(data, list)
         # Should only include scholarships due in next 30 days